@@ -0,0 +1,127 @@
+// TextGrounding.swift - OCR fast path for VLM grounding
+//
+// Most ghost_ground descriptions name a visible text label ("Compose button",
+// "Send", "Sign in link"). Apple's Vision text recognizer can find those
+// on-device, versus 0.5-3s for ShowUI-2B in the sidecar.
+//
+// VisionBridge.ground() tries this first, so on a miss its time is added to
+// the VLM's. It therefore uses the fast recognizer and logs its elapsed time
+// on every call, warning when it exceeds ocrBudgetMs. Only an unambiguous
+// match (exactly one recognized line close enough to the description) is
+// returned; anything else falls through to the VLM.
+
+import CoreGraphics
+import Foundation
+import Vision
+
+/// Text-label grounding via on-device OCR (no sidecar, no ML download).
+public enum TextGrounding {
+
+    /// Minimum label similarity (0-1) for an OCR line to count as a match.
+    static let matchThreshold = 0.8
+
+    /// OCR time (ms) above which a call is logged as a warning.
+    static let ocrBudgetMs = 200
+
+    /// Words that describe an element's role rather than its visible label.
+    private static let roleWords: Set<String> = [
+        "the", "a", "an", "button", "link", "tab", "icon", "field", "menu",
+        "item", "checkbox", "label", "text",
+    ]
+
+    /// Find a UI element whose visible text matches the description.
+    ///
+    /// - Parameters:
+    ///   - image: Decoded screenshot (shared with VisionBridge's upload path)
+    ///   - description: What to find (e.g., "Compose button")
+    ///   - screenWidth: Logical width the screenshot maps to
+    ///   - screenHeight: Logical height the screenshot maps to
+    /// - Returns: GroundResult in the same coordinate space as the sidecar's,
+    ///   or nil if there is no single confident text match.
+    public static func ground(
+        image: CGImage,
+        description: String,
+        screenWidth: Double,
+        screenHeight: Double
+    ) -> VisionBridge.GroundResult? {
+        let target = normalizedLabel(description)
+        guard !target.isEmpty else {
+            return nil
+        }
+
+        let start = Date()
+        let request = VNRecognizeTextRequest()
+        request.recognitionLevel = .fast
+        request.usesLanguageCorrection = false
+
+        do {
+            try VNImageRequestHandler(cgImage: image, options: [:]).perform([request])
+        } catch {
+            Log.debug("TextGrounding: OCR failed: \(error)")
+            return nil
+        }
+
+        var matches: [(score: Double, box: CGRect, text: String)] = []
+        for observation in request.results ?? [] {
+            guard let candidate = observation.topCandidates(1).first else { continue }
+            let score = labelSimilarity(target, normalizedLabel(candidate.string))
+                * Double(candidate.confidence)
+            if score >= matchThreshold {
+                matches.append((score, observation.boundingBox, candidate.string))
+            }
+        }
+
+        let elapsedMs = Int(Date().timeIntervalSince(start) * 1000)
+        if elapsedMs > ocrBudgetMs {
+            Log.warn("TextGrounding: OCR took \(elapsedMs)ms (budget \(ocrBudgetMs)ms)")
+        }
+        guard matches.count == 1, let match = matches.first else {
+            Log.debug("TextGrounding: \(matches.count) OCR matches for '\(description)' (\(elapsedMs)ms), deferring to VLM")
+            return nil
+        }
+
+        // Vision boxes are normalized with a bottom-left origin
+        let x = match.box.midX * screenWidth
+        let y = (1 - match.box.midY) * screenHeight
+        Log.info("TextGrounding: '\(description)' -> '\(match.text)' at (\(Int(x)), \(Int(y))) score=\(match.score) (\(elapsedMs)ms)")
+
+        return VisionBridge.GroundResult(
+            x: (x * 10).rounded() / 10,
+            y: (y * 10).rounded() / 10,
+            confidence: match.score,
+            raw: match.text,
+            method: "ocr-text-match",
+            inferenceMs: elapsedMs
+        )
+    }
+
+    // MARK: - Label Matching
+
+    /// Lowercase, split on non-alphanumerics, and drop role words.
+    /// "Compose button" -> "compose", "Sign-in link" -> "sign in".
+    static func normalizedLabel(_ text: String) -> String {
+        text.lowercased()
+            .split(whereSeparator: { !$0.isLetter && !$0.isNumber })
+            .map(String.init)
+            .filter { !roleWords.contains($0) }
+            .joined(separator: " ")
+    }
+
+    /// Similarity in 0-1: 1 minus the Levenshtein distance over the longer length.
+    static func labelSimilarity(_ a: String, _ b: String) -> Double {
+        let a = Array(a), b = Array(b)
+        guard !a.isEmpty, !b.isEmpty else { return 0 }
+
+        var previous = Array(0...b.count)
+        var current = [Int](repeating: 0, count: b.count + 1)
+        for i in 1...a.count {
+            current[0] = i
+            for j in 1...b.count {
+                let cost = a[i - 1] == b[j - 1] ? 0 : 1
+                current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            }
+            swap(&previous, &current)
+        }
+        return 1 - Double(previous[b.count]) / Double(max(a.count, b.count))
+    }
+}
@@ -16,6 +16,7 @@
 //   3. Sidecar lifecycle management (auto-start, track PID)
 
 import Foundation
+import ImageIO
 
 /// Bridge between Ghost OS v2 and the Python vision sidecar.
 /// All methods are synchronous (blocking) because the MCP server is synchronous.
@@ -34,7 +35,8 @@ public enum VisionBridge {
     private static let healthTimeout: TimeInterval = 2.0
 
     /// Timeout for VLM grounding (model inference can take 3-5s on first call,
-    /// then 0.5-3s on subsequent calls with warm model).
+    /// then 0.5-3s on subsequent calls with warm model). Keep it above the
+    /// sidecar's GROUND_TIMEOUT (25s) so a queued request surfaces as a 504.
     private static let groundTimeout: TimeInterval = 30.0
 
     /// Timeout for the first grounding call which also loads the model (~10-15s).
@@ -43,9 +45,20 @@ public enum VisionBridge {
     /// The sidecar process we started (if any). Stored to prevent zombie.
     nonisolated(unsafe) private static var sidecarProcess: Process?
 
+    /// Shared session so the sidecar's HTTP/1.1 keep-alive connection is
+    /// reused across /health and /ground calls instead of reconnecting each time.
+    private static let session = URLSession(configuration: .default)
+
     /// Whether we have completed at least one successful ground() call.
     nonisolated(unsafe) private static var hasCompletedFirstGround = false
 
+    /// Sidecar version from the last successful /health check.
+    nonisolated(unsafe) private static var sidecarVersion: String?
+
+    /// First sidecar version that accepts raw image bodies on /ground. An older
+    /// sidecar left running on the port parses every body as JSON.
+    private static let rawImageUploadMinVersion = "2.3.0"
+
     // MARK: - Health Check
 
     /// Check if the vision sidecar is running and responsive.
@@ -53,9 +66,16 @@ public enum VisionBridge {
         guard let result = httpGet(path: "/health", timeout: healthTimeout) else {
             return false
         }
+        sidecarVersion = result["version"] as? String
         return result["status"] != nil
     }
 
+    /// Whether the running sidecar accepts raw image bodies (see isAvailable()).
+    private static var sidecarAcceptsRawImages: Bool {
+        guard let sidecarVersion else { return false }
+        return sidecarVersion.compare(rawImageUploadMinVersion, options: .numeric) != .orderedAscending
+    }
+
     /// Get detailed health status from the sidecar.
     public static func healthCheck() -> [String: Any]? {
         httpGet(path: "/health", timeout: healthTimeout)
@@ -73,7 +93,7 @@ public enum VisionBridge {
         public let confidence: Double
         /// Raw model output text.
         public let raw: String
-        /// Method used: "full-screen" or "crop-based".
+        /// Method used: "full-screen", "crop-based", "centroid-fastpath", or "ocr-text-match".
         public let method: String
         /// Inference time in milliseconds.
         public let inferenceMs: Int
@@ -81,7 +101,9 @@ public enum VisionBridge {
 
     /// Find precise coordinates for a UI element using VLM grounding.
     ///
-    /// Auto-starts the vision sidecar if it's not already running.
+    /// Tries on-device OCR first (TextGrounding) and returns immediately when
+    /// exactly one visible text label matches the description. Otherwise
+    /// auto-starts the vision sidecar if it's not already running.
     ///
     /// - Parameters:
     ///   - imageBase64: Base64-encoded PNG screenshot
@@ -100,6 +122,27 @@ public enum VisionBridge {
         screenHeight: Double = 1117,
         cropBox: [Double]? = nil
     ) -> GroundResult? {
+        // Decode the screenshot once; OCR and the JPEG re-encode share the CGImage
+        guard let pngData = Data(base64Encoded: imageBase64) else {
+            Log.error("Vision: Screenshot is not valid base64")
+            return nil
+        }
+        let screenshot = CGImageSourceCreateWithData(pngData as CFData, nil)
+            .flatMap { CGImageSourceCreateImageAtIndex($0, 0, nil) }
+
+        // OCR fast path: an element with a unique visible label needs no VLM
+        if cropBox == nil,
+           let screenshot,
+           let textResult = TextGrounding.ground(
+               image: screenshot,
+               description: description,
+               screenWidth: screenWidth,
+               screenHeight: screenHeight
+           )
+        {
+            return textResult
+        }
+
         // Auto-start sidecar if not running
         if !isAvailable() {
             Log.info("Vision sidecar not running, attempting auto-start...")
@@ -109,20 +152,31 @@ public enum VisionBridge {
             }
         }
 
-        var payload: [String: Any] = [
-            "image": imageBase64,
-            "description": description,
-            "screen_w": screenWidth,
-            "screen_h": screenHeight,
-        ]
-        if let cropBox, cropBox.count == 4 {
-            payload["crop_box"] = cropBox
-        }
-
         // Use longer timeout for first call (model needs to load ~10-15s)
         let timeout = hasCompletedFirstGround ? groundTimeout : firstGroundTimeout
 
-        guard let result = httpPost(path: "/ground", body: payload, timeout: timeout) else {
+        let response: [String: Any]?
+        if sidecarAcceptsRawImages {
+            response = groundRaw(
+                pngData: pngData, screenshot: screenshot, description: description,
+                screenWidth: screenWidth, screenHeight: screenHeight,
+                cropBox: cropBox, timeout: timeout
+            )
+        } else {
+            // Older sidecar: base64 image in a JSON body
+            var body: [String: Any] = [
+                "image": imageBase64,
+                "description": description,
+                "screen_w": screenWidth,
+                "screen_h": screenHeight,
+            ]
+            if let cropBox, cropBox.count == 4 {
+                body["crop_box"] = cropBox
+            }
+            response = httpPost(path: "/ground", body: body, timeout: timeout)
+        }
+
+        guard let result = response else {
             Log.warn("Vision sidecar /ground request failed")
             return nil
         }
@@ -146,6 +200,45 @@ public enum VisionBridge {
         )
     }
 
+    /// POST /ground with the image as a raw body and parameters in the query
+    /// string (sidecar 2.3.0+). Returns parsed JSON or nil.
+    private static func groundRaw(
+        pngData: Data,
+        screenshot: CGImage?,
+        description: String,
+        screenWidth: Double,
+        screenHeight: Double,
+        cropBox: [Double]?,
+        timeout: TimeInterval
+    ) -> [String: Any]? {
+        // Send the image as a raw body with parameters in the query string, so the
+        // sidecar skips the base64 inflation and JSON-string decode of a multi-MB image.
+        var imageData = pngData
+        var contentType = "image/png"
+        var query = [
+            URLQueryItem(name: "description", value: description),
+            URLQueryItem(name: "screen_w", value: String(screenWidth)),
+            URLQueryItem(name: "screen_h", value: String(screenHeight)),
+        ]
+        if let cropBox, cropBox.count == 4 {
+            query.append(URLQueryItem(
+                name: "crop_box", value: cropBox.map { String($0) }.joined(separator: ",")
+            ))
+        } else if let screenshot, let jpeg = prescaledJPEG(from: screenshot) {
+            // Full-screen: the screenshot is already at VLM size, so a JPEG lets the
+            // sidecar skip the PNG inflate; it only snaps the size to the patch grid.
+            // Crops keep the lossless PNG since they are cut from the full image.
+            imageData = jpeg
+            contentType = "image/jpeg"
+            query.append(URLQueryItem(name: "image_is_prescaled", value: "1"))
+        }
+
+        return httpPostImage(
+            path: "/ground", image: imageData, contentType: contentType,
+            query: query, timeout: timeout
+        )
+    }
+
     // MARK: - Sidecar Lifecycle
 
     /// Attempt to start the vision sidecar process.
@@ -321,16 +414,44 @@ public enum VisionBridge {
 
     // MARK: - Model Path Resolution
 
-    /// Check if the ShowUI-2B model exists at any known location.
-    /// Returns the path if found, nil otherwise.
-    public static func findModelPath() -> String? {
-        let candidates = [
+    /// Known ShowUI-2B locations, in the same order as the sidecar's
+    /// resolve_model_path() with its default 4-bit quantization.
+    public static var modelCandidates: [String] {
+        let bases = [
             "/opt/homebrew/share/ghost-os/models/ShowUI-2B",
             NSHomeDirectory() + "/.ghost-os/models/ShowUI-2B",
-            NSHomeDirectory() + "/.shadow/models/llm/ShowUI-2B-bf16-8bit",
         ]
+        let variants = prefersFP16 ? ["-4bit-fp16", "-4bit", "-fp16"] : ["-4bit"]
+        return variants.flatMap { suffix in bases.map { $0 + suffix } }
+            + bases
+            + [NSHomeDirectory() + "/.shadow/models/llm/ShowUI-2B-bf16-8bit"]
+    }
 
-        for path in candidates {
+    /// True on Apple M1/M2, where the sidecar prefers float16 model builds
+    /// (no native bf16 on those GPUs). Mirrors _prefers_fp16() in server.py.
+    static let prefersFP16: Bool = {
+        var size = 0
+        guard sysctlbyname("machdep.cpu.brand_string", nil, &size, nil, 0) == 0, size > 0 else {
+            return false
+        }
+        var buffer = [UInt8](repeating: 0, count: size)
+        guard sysctlbyname("machdep.cpu.brand_string", &buffer, &size, nil, 0) == 0 else {
+            return false
+        }
+        let brand = String(decoding: buffer.prefix { $0 != 0 }, as: UTF8.self)
+        guard brand.hasPrefix("Apple M"),
+              let generation = Int(brand.dropFirst("Apple M".count).prefix(while: \.isNumber))
+        else {
+            return false
+        }
+        return generation < 3
+    }()
+
+    /// Check if the ShowUI-2B model exists at any known location.
+    /// Returns the path if found, nil otherwise. Mirrors resolve_model_path()
+    /// in server.py: 4-bit builds are preferred over bf16.
+    public static func findModelPath() -> String? {
+        for path in modelCandidates {
             let safetensors = (path as NSString).appendingPathComponent("model.safetensors")
             let config = (path as NSString).appendingPathComponent("config.json")
             if FileManager.default.fileExists(atPath: safetensors)
@@ -342,6 +463,30 @@ public enum VisionBridge {
         return nil
     }
 
+    // MARK: - Image Encoding
+
+    /// Largest edge the sidecar feeds to ShowUI-2B (VLM_MAX_EDGE in server.py).
+    private static let vlmMaxEdge = 1280
+
+    /// Re-encode a decoded screenshot as JPEG (quality 0.85) if it is already
+    /// within the VLM's pixel budget. Returns nil if it is larger or encoding fails.
+    private static func prescaledJPEG(from image: CGImage) -> Data? {
+        guard max(image.width, image.height) <= vlmMaxEdge else {
+            return nil
+        }
+
+        let output = NSMutableData()
+        guard let destination = CGImageDestinationCreateWithData(
+            output, "public.jpeg" as CFString, 1, nil
+        ) else {
+            return nil
+        }
+        let options = [kCGImageDestinationLossyCompressionQuality: 0.85] as CFDictionary
+        CGImageDestinationAddImage(destination, image, options)
+        guard CGImageDestinationFinalize(destination) else { return nil }
+        return output as Data
+    }
+
     // MARK: - HTTP Helpers
 
     /// Synchronous HTTP GET. Returns parsed JSON or nil.
@@ -375,6 +520,30 @@ public enum VisionBridge {
         return performRequest(request)
     }
 
+    /// Synchronous HTTP POST with a raw image body and parameters in the query
+    /// string. Returns parsed JSON or nil.
+    private static func httpPostImage(
+        path: String,
+        image: Data,
+        contentType: String,
+        query: [URLQueryItem],
+        timeout: TimeInterval
+    ) -> [String: Any]? {
+        guard var components = URLComponents(string: baseURL + path) else { return nil }
+        components.queryItems = query
+        // URLComponents leaves "+" unescaped, but the sidecar decodes it as a space
+        components.percentEncodedQuery = components.percentEncodedQuery?
+            .replacingOccurrences(of: "+", with: "%2B")
+        guard let url = components.url else { return nil }
+
+        var request = URLRequest(url: url, timeoutInterval: timeout)
+        request.httpMethod = "POST"
+        request.addValue(contentType, forHTTPHeaderField: "Content-Type")
+        request.httpBody = image
+
+        return performRequest(request)
+    }
+
     /// Perform a synchronous URLSession request. Blocks the calling thread
     /// using a semaphore (acceptable since MCP server is single-threaded).
     private static func performRequest(_ request: URLRequest) -> [String: Any]? {
@@ -389,8 +558,6 @@ public enum VisionBridge {
         }
         let box = ResponseBox()
 
-        // Use a detached session to avoid MainActor issues
-        let session = URLSession(configuration: .default)
         let task = session.dataTask(with: request) { data, _, error in
             box.data = data
             box.error = error
@@ -397,9 +397,12 @@ struct Doctor {
             if !foundPytorch {
                 print("  [!] ShowUI-2B model: not found")
                 print("    Checked:")
-                print("      /opt/homebrew/share/ghost-os/models/ShowUI-2B/")
-                print("      ~/.ghost-os/models/ShowUI-2B/")
-                print("      ~/.shadow/models/llm/ShowUI-2B-bf16-8bit/")
+                for path in VisionBridge.modelCandidates {
+                    let display = path.hasPrefix(NSHomeDirectory())
+                        ? "~" + String(path.dropFirst(NSHomeDirectory().count))
+                        : path
+                    print("      \(display)/")
+                }
                 print("    Fix: ghost setup (downloads the model)")
                 warningCount += 1
             }
@@ -0,0 +1,37 @@
+// TextGroundingTests.swift - Unit tests for TextGrounding label matching
+
+import Testing
+@testable import GhostOS
+
+@Suite("TextGrounding Tests")
+struct TextGroundingTests {
+
+    @Test("Role words are stripped from descriptions")
+    func stripsRoleWords() {
+        #expect(TextGrounding.normalizedLabel("Compose button") == "compose")
+        #expect(TextGrounding.normalizedLabel("the Sign-in link") == "sign in")
+    }
+
+    @Test("Description made only of role words normalizes to empty")
+    func onlyRoleWords() {
+        #expect(TextGrounding.normalizedLabel("Text field").isEmpty)
+    }
+
+    @Test("Identical labels are a perfect match")
+    func identicalLabels() {
+        #expect(TextGrounding.labelSimilarity("compose", "compose") == 1.0)
+    }
+
+    @Test("An OCR slip scores partial similarity")
+    func ocrSlip() {
+        let score = TextGrounding.labelSimilarity("compose", "cornpose")
+        #expect(score < 1.0)
+        #expect(score >= 0.7)
+    }
+
+    @Test("Unrelated labels score low")
+    func unrelatedLabels() {
+        #expect(TextGrounding.labelSimilarity("send", "archive") < TextGrounding.matchThreshold)
+        #expect(TextGrounding.labelSimilarity("", "send") == 0)
+    }
+}
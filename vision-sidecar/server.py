@@ -12,37 +12,65 @@ Architecture:
 Endpoints:
   GET  /health    — Check if models are loaded and server is ready
   POST /ground    — Find precise coordinates for a described element
+                    (JSON with base64 image, or raw image body + query params)
+  POST /ground_raw — /ground with a raw image body whatever its Content-Type;
+                    description may come from the (percent-encoded) X-Description header
   POST /detect    — Detect all interactive elements (YOLO) [placeholder]
   POST /parse     — Combined detect + context analysis [placeholder]
 
 The server uses Python's built-in http.server to minimize dependencies.
-Models are loaded lazily on first request and kept warm in memory.
+Each connection gets its own thread; /ground inference is funneled through a
+single batching worker so concurrent requests share the model safely.
+Models are loaded and warmed up in the background at startup (or on first
+request with --lazy) and kept warm in memory.
 
 Usage:
   python3 server.py                           # Default: port 9876, auto-detect model
   python3 server.py --port 9877               # Custom port
   python3 server.py --model-path /path/to/model  # Explicit model path
   python3 server.py --idle-timeout 600        # Auto-exit after 10 min idle (default)
+  python3 server.py --lazy                    # Load the model on first /ground instead
   python3 server.py --health-check            # Test model loading, then exit
   python3 server.py --version                 # Print version
 """
 
-__version__ = "2.2.1"
+__version__ = "2.3.0"
 
 import argparse
 import base64
+import concurrent.futures
+import hashlib
 import io
 import json
+import math
 import os
+import queue
 import re
 import signal
+import subprocess
 import sys
-import tempfile
 import time
 import traceback
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
-from threading import Lock, Timer
+from urllib.parse import parse_qs, unquote, urlsplit
+from threading import Lock, Thread
+
+try:
+    # Optional: parses/serializes in C straight from/to bytes, which matters
+    # for multi-MB base64 /ground bodies. Falls back to the stdlib json module.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional (cykooz.resizer 2.x): SIMD convolution resize (NEON on Apple
+    # Silicon, AVX2/SSE4.1 on x86), ~10x faster than Pillow's Lanczos for U8x3.
+    from cykooz.resizer import FilterType, ResizeAlg, Resizer
+    _simd_resizer = Resizer(ResizeAlg.convolution(FilterType.lanczos3))
+except ImportError:
+    _simd_resizer = None
 
 # ── Configuration ──────────────────────────────────────────────────
 
@@ -54,22 +82,66 @@ IDLE_TIMEOUT = 600  # seconds (0 = no timeout)
 
 # ── Model Path Resolution ─────────────────────────────────────────
 
-def resolve_model_path(explicit_path=None):
+def _prefers_fp16() -> bool:
+    """
+    True on Apple M1/M2, whose GPUs have no native bf16 matmul path; float16
+    weights run prompt processing ~20% faster there. M3+ handles bf16 natively.
+    """
+    if sys.platform != "darwin":
+        return False
+    try:
+        brand = subprocess.run(
+            ["sysctl", "-n", "machdep.cpu.brand_string"],
+            capture_output=True, text=True, timeout=2,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return False
+    match = re.match(r"Apple M(\d+)", brand.strip())
+    return match is not None and int(match.group(1)) < 3
+
+
+def resolve_model_path(explicit_path=None, quant="4bit"):
     """
     Find the ShowUI-2B model in order of priority:
       1. Explicit --model-path argument
-      2. /opt/homebrew/share/ghost-os/models/ShowUI-2B/ (Homebrew install)
-      3. ~/.ghost-os/models/ShowUI-2B/ (user-local install)
-      4. ~/.shadow/models/llm/ShowUI-2B-bf16-8bit/ (legacy Shadow path)
+      2. Variants next to the Homebrew and user-local locations below:
+         ShowUI-2B-4bit/ when quant="4bit", preceded on M1/M2 by float16
+         builds (ShowUI-2B-4bit-fp16/, and ShowUI-2B-fp16/ before the bf16 base)
+      3. /opt/homebrew/share/ghost-os/models/ShowUI-2B/ (Homebrew install)
+      4. ~/.ghost-os/models/ShowUI-2B/ (user-local install)
+      5. ~/.shadow/models/llm/ShowUI-2B-bf16-8bit/ (legacy Shadow path)
+
+    Token decode is memory-bandwidth bound, so 4-bit weights roughly double
+    decode throughput over bf16/8-bit. The bf16 builds remain the fallback.
+    A 4-bit build is produced from the original checkpoint with:
+
+      python -m mlx_vlm.convert --hf-path showlab/ShowUI-2B -q \
+          --q-bits 4 --q-group-size 64 --mlx-path ~/.ghost-os/models/ShowUI-2B-4bit
+
+    (add --dtype float16 and a -4bit-fp16 suffix for the M1/M2 build).
+    mlx_vlm.load() detects the quantization from config.json, so no loader
+    changes are needed.
 
     Returns the first path that exists and contains model.safetensors,
-    or the first candidate path (for error messages) if none found.
+    or the first non-variant candidate path (for error messages) if none found.
     """
     candidates = []
 
     if explicit_path:
         candidates.append(explicit_path)
 
+    fp16 = _prefers_fp16()
+    variants = []
+    if quant == "4bit":
+        variants += ["-4bit-fp16", "-4bit"] if fp16 else ["-4bit"]
+    if fp16:
+        variants.append("-fp16")
+    for suffix in variants:
+        candidates.extend([
+            "/opt/homebrew/share/ghost-os/models/ShowUI-2B" + suffix,
+            str(Path.home() / ".ghost-os/models/ShowUI-2B") + suffix,
+        ])
+
     candidates.extend([
         "/opt/homebrew/share/ghost-os/models/ShowUI-2B",
         str(Path.home() / ".ghost-os/models/ShowUI-2B"),
@@ -92,8 +164,8 @@ def resolve_model_path(explicit_path=None):
                     f"Download may be incomplete. "
                     f"Fix: rm -rf {path} && ghost setup")
 
-    # Return first candidate for error message
-    return candidates[0] if candidates else str(Path.home() / ".ghost-os/models/ShowUI-2B")
+    # Return first non-variant candidate for error message
+    return explicit_path or "/opt/homebrew/share/ghost-os/models/ShowUI-2B"
 
 
 # ── Model State (lazy-loaded, thread-safe) ─────────────────────────
@@ -102,7 +174,46 @@ _vlm_model = None
 _vlm_processor = None
 _vlm_tokenizer = None
 _vlm_lock = Lock()
+# MLX generation is not re-entrant. The batch worker is the only caller today;
+# this keeps it that way if another path ever calls _vlm_ground() directly.
+_vlm_infer_lock = Lock()
+# Bumped whenever the model state reported by /health changes
+_health_state_version = 0
 _vlm_load_error = None
+_vlm_prompt_template = None  # (prefix, suffix) around the description
+
+# ShowUI-2B prompt format
+SHOWUI_SYSTEM_TEXT = (
+    "Based on the screenshot of the page, I give a text description and you give its "
+    "corresponding location. The coordinate represents a clickable location [x, y] for "
+    "an element, which is a relative coordinate on the screenshot, scaled from 0 to 1."
+)
+_DESCRIPTION_SENTINEL = "<<GHOST_DESCRIPTION>>"
+
+# ShowUI-2B's pixel budget: images are downscaled to this max edge
+VLM_MAX_EDGE = 1280
+
+# Qwen2-VL's image processor resizes every image to a multiple of this
+# (14 px patches, 2x2 merge)
+VLM_PATCH = 28
+
+# Qwen2-VL's default smart_resize pixel bounds; the loaded processor's own
+# min_pixels / max_pixels take precedence (see _vlm_pixel_bounds)
+VLM_MIN_PIXELS = 56 * 56
+VLM_MAX_PIXELS = 1280 * VLM_PATCH * VLM_PATCH
+
+# Grounding output is a single "[0.42, 0.31]" (~12 tokens). Anything past the
+# closing bracket is wasted sequential decode.
+GROUND_MAX_TOKENS = 24
+_STOP_CHARS = ("]", ")")
+
+# [x, y] or (x, y) coordinates in model output
+_COORD_RE = re.compile(r'[\(\[]\s*([\d.]+)\s*,\s*([\d.]+)\s*[\)\]]')
+
+# A crop this small (logical pt^2, e.g. 100x40) around a plain "click this"
+# target is answered with its center instead of a 0.5-3s VLM call.
+CENTROID_MAX_AREA = 4000
+_SIMPLE_CLICK_RE = re.compile(r"\b(click|tap)\b|\bpress\b.*\bbutton\b", re.IGNORECASE)
 
 
 def _check_transformers_version():
@@ -121,9 +232,29 @@ def _check_transformers_version():
     return True
 
 
+def _build_prompt_template():
+    """
+    Render the chat template once with a sentinel description.
+
+    Only the description varies between requests, so the rendered scaffolding
+    (role tokens, vision placeholder, system text) is split around the sentinel
+    and reused instead of re-running the Jinja template on every call.
+    """
+    chat = [{"role": "user", "content": [
+        {"type": "image"},
+        {"type": "text", "text": f"{SHOWUI_SYSTEM_TEXT}\n{_DESCRIPTION_SENTINEL}"}
+    ]}]
+    formatted = _vlm_tokenizer.apply_chat_template(
+        chat, tokenize=False, add_generation_prompt=True
+    )
+    prefix, suffix = formatted.split(_DESCRIPTION_SENTINEL)
+    return prefix, suffix
+
+
 def _load_vlm():
     """Load ShowUI-2B model. Retries on each call if previously failed."""
-    global _vlm_model, _vlm_processor, _vlm_tokenizer, _vlm_load_error
+    global _vlm_model, _vlm_processor, _vlm_tokenizer, _vlm_load_error, _vlm_prompt_template
+    global _health_state_version
 
     with _vlm_lock:
         if _vlm_model is not None:
@@ -135,8 +266,10 @@ def _load_vlm():
             log(f"Loading ShowUI-2B from {MODEL_PATH}...")
             t0 = time.time()
 
+            # lazy=True skips materializing every weight up front; quantized
+            # weights are mapped in on first use (the warmup pass below).
             from mlx_vlm import load
-            _vlm_model, _vlm_processor = load(MODEL_PATH)
+            _vlm_model, _vlm_processor = load(MODEL_PATH, lazy=True)
 
             # CRITICAL: Force the slow image processor. The fast Qwen2VLImageProcessor
             # requires PyTorch tensors which MLX doesn't provide.
@@ -147,11 +280,16 @@ def _load_vlm():
 
             from transformers import AutoTokenizer
             _vlm_tokenizer = AutoTokenizer.from_pretrained(MODEL_PATH)
+            _vlm_prompt_template = _build_prompt_template()
 
             log(f"ShowUI-2B loaded in {time.time() - t0:.1f}s")
+            log(f"Image backends: {_image_backends()}")
+            _warmup_generate()
+            _health_state_version += 1
             return True
         except Exception as e:
             _vlm_load_error = str(e)
+            _health_state_version += 1
             err_str = str(e)
             # Diagnose the specific transformers version incompatibility
             if "AutoVideoProcessor" in err_str or "Torchvision" in err_str \
@@ -165,12 +303,97 @@ def _load_vlm():
             return False
 
 
-def _vlm_ground(image_path: str, description: str, screen_w: float, screen_h: float) -> dict:
+def _warmup_generate():
+    """
+    Decode one token on a blank image so a loaded model is ready for traffic.
+
+    load() does not run anything: the first generate call maps the lazy
+    weights, compiles Metal kernels and allocates the KV cache. Doing that
+    here keeps it off the first real /ground, whichever path loaded the model.
+    A failure is logged, not raised; the first request then pays the cost.
+    """
+    from mlx_vlm import stream_generate
+    from PIL import Image
+
+    prefix, suffix = _vlm_prompt_template
+    t0 = time.time()
+    try:
+        with _vlm_infer_lock:
+            for _ in stream_generate(
+                _vlm_model, _vlm_processor, prefix + "warmup" + suffix,
+                image=Image.new("RGB", (2 * VLM_PATCH, 2 * VLM_PATCH), "gray"),
+                max_tokens=1,
+                temp=0.0
+            ):
+                break
+        log(f"VLM warmup done (warmup_ms={int((time.time() - t0) * 1000)})")
+    except Exception as e:
+        log(f"VLM warmup failed: {e}")
+
+
+def _image_backends() -> str:
+    """
+    Describe the active decode/resize backends, e.g.
+    "jpeg libjpeg-turbo 3.1.0, zlib 1.3.1, resize cykooz".
+
+    A Pillow wheel without libjpeg-turbo, or a missing cykooz.resizer, makes
+    every /ground slower; logging it at load keeps such regressions visible.
+    """
+    from PIL import features
+
+    jpeg = "libjpeg-turbo" if features.check_feature("libjpeg_turbo") else "libjpeg"
+    resize = "cykooz" if _simd_resizer is not None else "pillow"
+    return (f"jpeg {jpeg} {features.version('jpg')}, "
+            f"zlib {features.version('zlib')}, resize {resize}")
+
+
+def _vlm_pixel_bounds():
+    """(min_pixels, max_pixels) the loaded image processor's smart_resize enforces."""
+    processor = getattr(_vlm_processor, "image_processor", None)
+    return (
+        getattr(processor, "min_pixels", None) or VLM_MIN_PIXELS,
+        getattr(processor, "max_pixels", None) or VLM_MAX_PIXELS,
+    )
+
+
+def _prepare_vlm_image(img):
+    """Convert a PIL image to RGB and fit it to ShowUI-2B's pixel budget and patch grid."""
+    from PIL import Image
+
+    img = img.convert("RGB")
+    w, h = img.size
+
+    # Downscale to ~1280px max edge and the processor's pixel budget, then
+    # floor each side to the patch grid. Flooring (not rounding) keeps the
+    # result within both limits, so it is a fixed point of the processor's
+    # smart_resize and its (slow, Python-side) resize becomes a same-size pass.
+    # With cykooz.resizer installed this is a SIMD Lanczos3 resize on the RGB
+    # image; otherwise Pillow's bilinear, which is plenty at this scale.
+    min_pixels, max_pixels = _vlm_pixel_bounds()
+    scale = min(1.0, VLM_MAX_EDGE / max(w, h), math.sqrt(max_pixels / (w * h)))
+    new_w = max(VLM_PATCH, int(w * scale) // VLM_PATCH * VLM_PATCH)
+    new_h = max(VLM_PATCH, int(h * scale) // VLM_PATCH * VLM_PATCH)
+    if new_w * new_h < min_pixels:
+        # Tiny crop: upscale the way smart_resize would
+        up = math.sqrt(min_pixels / (new_w * new_h))
+        new_w = math.ceil(new_w * up / VLM_PATCH) * VLM_PATCH
+        new_h = math.ceil(new_h * up / VLM_PATCH) * VLM_PATCH
+    if (new_w, new_h) != (w, h):
+        if _simd_resizer is not None:
+            resized = Image.new("RGB", (new_w, new_h))
+            _simd_resizer.resize_pil(img, resized)
+            img = resized
+        else:
+            img = img.resize((new_w, new_h), Image.BILINEAR)
+    return img
+
+
+def _vlm_ground(img, description: str, screen_w: float, screen_h: float) -> dict:
     """
     Run ShowUI-2B grounding on an image.
 
     Args:
-        image_path: Path to image file (will be resized internally)
+        img: PIL image already passed through _prepare_vlm_image()
         description: What to find (e.g., "Compose button")
         screen_w: Logical width in points (used to scale normalized output)
         screen_h: Logical height in points
@@ -178,116 +401,254 @@ def _vlm_ground(image_path: str, description: str, screen_w: float, screen_h: fl
     Returns:
         {"x": float, "y": float, "confidence": float, "raw": str}
     """
-    from PIL import Image
-
-    # Resize to ~1280px max edge for ShowUI-2B's pixel budget
-    img = Image.open(image_path)
-    max_edge = 1280
-    w, h = img.size
-    _f = tempfile.NamedTemporaryFile(suffix=".jpg", prefix="ghost_vlm_", delete=False)
-    resized_path = _f.name
-    _f.close()
-    if max(w, h) > max_edge:
-        scale = max_edge / max(w, h)
-        img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-    img.convert("RGB").save(resized_path, format="JPEG", quality=85)
-
-    # ShowUI-2B prompt format
-    system_text = (
-        "Based on the screenshot of the page, I give a text description and you give its "
-        "corresponding location. The coordinate represents a clickable location [x, y] for "
-        "an element, which is a relative coordinate on the screenshot, scaled from 0 to 1."
-    )
-    prompt = f"{system_text}\n{description}"
-
     from mlx_vlm import stream_generate
 
-    # Build chat template
-    chat = [{"role": "user", "content": [
-        {"type": "image", "image": resized_path},
-        {"type": "text", "text": prompt}
-    ]}]
-    formatted = _vlm_tokenizer.apply_chat_template(
-        chat, tokenize=False, add_generation_prompt=True
-    )
+    # Splice the description into the pre-rendered chat template
+    prefix, suffix = _vlm_prompt_template
+    formatted = prefix + description + suffix
 
-    # Run inference
+    # Run inference. mlx-vlm 0.1.15's generate() is itself a Python loop over
+    # stream_generate(), so iterate directly and join the pieces once.
+    # It has no stop-string support either, so stop as soon as a complete
+    # coordinate pair has been decoded. The regex only runs when a closing
+    # bracket arrives, and its match is reused for parsing below.
     t0 = time.time()
-    full_text = ""
-    for result in stream_generate(
-        _vlm_model, _vlm_processor, formatted,
-        image=resized_path,
-        max_tokens=128,
-        temp=0.0
-    ):
-        full_text += result.text if hasattr(result, 'text') else str(result)
+    pieces = []
+    match = None
+    with _vlm_infer_lock:
+        for result in stream_generate(
+            _vlm_model, _vlm_processor, formatted,
+            image=img,
+            max_tokens=GROUND_MAX_TOKENS,
+            temp=0.0
+        ):
+            text = result.text if hasattr(result, 'text') else str(result)
+            pieces.append(text)
+            if any(c in text for c in _STOP_CHARS):
+                match = _COORD_RE.search("".join(pieces))
+                if match:
+                    break
+    full_text = "".join(pieces)
 
     elapsed = time.time() - t0
     log(f"VLM '{description}' -> '{full_text.strip()}' ({elapsed:.1f}s)")
 
-    # Clean up temp file
-    try:
-        os.unlink(resized_path)
-    except OSError:
-        pass
-
-    # Parse [x, y] or (x, y) coordinates from model output
-    match = re.search(r'[\(\[]\s*([\d.]+)\s*,\s*([\d.]+)\s*[\)\]]', full_text)
-    if match:
-        nx, ny = float(match.group(1)), float(match.group(2))
-        if nx <= 1.0 and ny <= 1.0:
-            return {
-                "x": round(nx * screen_w, 1),
-                "y": round(ny * screen_h, 1),
-                "normalized_x": round(nx, 4),
-                "normalized_y": round(ny, 4),
-                "confidence": 0.8,
-                "raw": full_text.strip(),
-                "inference_ms": int(elapsed * 1000),
-            }
-        else:
-            # Model returned pixel coordinates instead of normalized
-            return {
-                "x": round(nx, 1),
-                "y": round(ny, 1),
-                "normalized_x": round(nx / screen_w, 4),
-                "normalized_y": round(ny / screen_h, 4),
-                "confidence": 0.6,
-                "raw": full_text.strip(),
-                "inference_ms": int(elapsed * 1000),
-            }
-
-    # Failed to parse coordinates
+    raw = full_text.strip()
+    inference_ms = int(elapsed * 1000)
+
+    # [x, y] or (x, y) coordinates, already matched in the decode loop
+    if not match:
+        return {
+            "x": round(screen_w / 2, 1),
+            "y": round(screen_h / 2, 1),
+            "normalized_x": 0.5,
+            "normalized_y": 0.5,
+            "confidence": 0.0,
+            "raw": raw,
+            "inference_ms": inference_ms,
+            "error": "Failed to parse coordinates from model output",
+        }
+
+    # Expected output is normalized [0, 1]; anything larger means the model
+    # returned pixel coordinates instead (less reliable, lower confidence).
+    nx, ny = float(match.group(1)), float(match.group(2))
+    is_px = nx > 1.0 or ny > 1.0
+    px, py = (nx, ny) if is_px else (nx * screen_w, ny * screen_h)
+    inv_w, inv_h = 1.0 / screen_w, 1.0 / screen_h
     return {
-        "x": round(screen_w / 2, 1),
-        "y": round(screen_h / 2, 1),
-        "normalized_x": 0.5,
-        "normalized_y": 0.5,
-        "confidence": 0.0,
-        "raw": full_text.strip(),
-        "inference_ms": int(elapsed * 1000),
-        "error": "Failed to parse coordinates from model output",
+        "x": round(px, 1),
+        "y": round(py, 1),
+        "normalized_x": round(px * inv_w, 4),
+        "normalized_y": round(py * inv_h, 4),
+        "confidence": 0.6 if is_px else 0.8,
+        "raw": raw,
+        "inference_ms": inference_ms,
+    }
+
+
+# ── Caches ────────────────────────────────────────────────────────
+#
+# Agents often re-ask for the same element on an unchanged screen (retry
+# loops, re-verification), or search one screenshot for several elements.
+# Identical requests are answered from a result LRU keyed by (image hash,
+# description, crop_box, screen size) without touching the VLM, and the
+# decoded + resized input image is kept for a few recent screenshots so a
+# new description on the same screen skips PNG decode and resize.
+
+RESULT_CACHE_SIZE = 512  # results are a few hundred bytes each
+IMAGE_CACHE_SIZE = 4  # prepared images are ~5 MB each
+
+
+class _LRUCache:
+    """Small thread-safe LRU map."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+_result_cache = _LRUCache(RESULT_CACHE_SIZE)
+_image_cache = _LRUCache(IMAGE_CACHE_SIZE)
+
+
+def _image_hash(image_data: bytes) -> bytes:
+    """Content hash of an encoded image, used as a cache/sharing key."""
+    return hashlib.blake2b(image_data, digest_size=16).digest()
+
+
+def _result_cache_key(image_hash: bytes, description: str, crop_box, screen_w: float, screen_h: float):
+    return (image_hash, description, tuple(crop_box) if crop_box else None, screen_w, screen_h)
+
+
+def _image_cache_key(image_hash: bytes, crop_box, screen_w: float, screen_h: float):
+    """Identifies the VLM input pixels: the screenshot plus the crop taken from it."""
+    if not crop_box:
+        return (image_hash, None)
+    return (image_hash, tuple(crop_box), screen_w, screen_h)
+
+
+# ── Request Batching ──────────────────────────────────────────────
+#
+# HTTP handler threads never touch the model directly. They enqueue a request
+# with a Future and block on it; the batch worker is the only thread that runs
+# MLX, so the handler pool stays free for /health and new POSTs. The worker
+# drains up to BATCH_MAX requests that arrive within BATCH_WINDOW of each other
+# and hands them to _vlm_ground_batch together.
+#
+# mlx-vlm 0.1.15 has no batched generate, so a batch would still be decoded
+# item by item and the window would only add latency to every request (the
+# image cache already shares prepared screenshots across batches). Batches
+# stay at one request until _vlm_ground_batch has a real batched forward pass.
+
+BATCH_MAX = 1          # max /ground requests per batch (1 = no batching window)
+BATCH_WINDOW = 0.020   # seconds to wait for more requests after the first
+
+# How long a handler waits for its queued /ground result before answering 504.
+# Kept well below VisionBridge's 30s groundTimeout, whose clock also covers the
+# upload, decode and hashing, so the client actually receives the 504 instead
+# of timing out first. The model load happens before queueing, so it does not
+# count against this. A request already being decoded runs to completion.
+GROUND_TIMEOUT = 25.0
+
+_req_queue = queue.Queue()
+
+
+def _submit_ground(img, description: str, screen_w: float, screen_h: float,
+                   image_key=None, prepared=None,
+                   timeout: float = GROUND_TIMEOUT) -> dict:
+    """
+    Queue a grounding request for the batch worker and wait for its result.
+
+    img is a decoded PIL image, or None when the caller already holds the
+    prepared image for image_key from the image cache and passes it as
+    prepared. image_key identifies the pixels (see _image_cache_key); requests
+    with the same key share one preprocessed image.
+
+    Raises concurrent.futures.TimeoutError after timeout seconds (None waits
+    forever). A request still queued at that point is cancelled and skipped.
+    """
+    item = {
+        "image": img,
+        "image_key": image_key,
+        "prepared": prepared,
+        "description": description,
+        "screen_w": screen_w,
+        "screen_h": screen_h,
+        "future": concurrent.futures.Future(),
     }
+    _req_queue.put(item)
+    try:
+        return item["future"].result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        item["future"].cancel()
+        raise
+
+
+def _batch_worker():
+    """Collect queued /ground requests into batches. Runs forever on a daemon thread."""
+    while True:
+        batch = [_req_queue.get()]
+        deadline = time.monotonic() + BATCH_WINDOW
+        while len(batch) < BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_req_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _vlm_ground_batch(batch)
+
+
+def _vlm_ground_batch(items: list):
+    """
+    Run a batch of grounding requests and resolve each waiting handler's future.
+
+    Agents often ask for several elements on the same screenshot at once
+    ("find Compose", "find Reply", ...), so each distinct image_key is
+    converted and resized once and shared through the image cache.
+
+    mlx-vlm 0.1.15 (the pinned version) has no batched generate for Qwen2-VL,
+    so items are decoded back-to-back on this thread. This is the single place
+    to switch to a batched forward pass once the pinned mlx-vlm supports it.
+    """
+    if len(items) > 1:
+        log(f"VLM batch of {len(items)} requests")
+    for item in items:
+        future = item["future"]
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            key = item["image_key"]
+            if item["prepared"] is not None:
+                img = item["prepared"]
+            else:
+                # An earlier item in this batch may have prepared the same pixels
+                img = _image_cache.get(key) if key is not None else None
+                if img is None:
+                    img = _prepare_vlm_image(item["image"])
+                    if key is not None:
+                        _image_cache.put(key, img)
+            future.set_result(_vlm_ground(
+                img, item["description"], item["screen_w"], item["screen_h"]
+            ))
+        except Exception as e:
+            future.set_exception(e)
 
 
 # ── Idle Timeout ──────────────────────────────────────────────────
 
-_idle_timer = None
-_idle_lock = Lock()
+_last_request = time.monotonic()
 
 
 def _reset_idle_timer():
-    """Reset the idle timeout. Called on every request."""
-    global _idle_timer
-    if IDLE_TIMEOUT <= 0:
-        return
+    """Record request activity for the idle watchdog. Called on every request."""
+    global _last_request
+    _last_request = time.monotonic()  # single float store, atomic under the GIL
 
-    with _idle_lock:
-        if _idle_timer is not None:
-            _idle_timer.cancel()
-        _idle_timer = Timer(IDLE_TIMEOUT, _idle_shutdown)
-        _idle_timer.daemon = True
-        _idle_timer.start()
+
+def _idle_watchdog():
+    """Shut down once no request has arrived for IDLE_TIMEOUT. Runs on a daemon thread."""
+    while True:
+        time.sleep(min(IDLE_TIMEOUT, 30))
+        if time.monotonic() - _last_request > IDLE_TIMEOUT:
+            _idle_shutdown()
+            return
 
 
 def _idle_shutdown():
@@ -302,8 +663,15 @@ def _idle_shutdown():
 class VisionHandler(BaseHTTPRequestHandler):
     """Handles HTTP requests for the vision sidecar."""
 
+    # HTTP/1.1 keeps the client's socket open across /health and /ground calls.
+    # Every response must carry Content-Length (see _send_json).
+    protocol_version = "HTTP/1.1"
+
     MAX_BODY_SIZE = 50 * 1024 * 1024  # 50 MB
 
+    # Content types accepted as a raw image body on /ground
+    RAW_IMAGE_TYPES = ("image/png", "image/jpeg", "application/octet-stream")
+
     def do_GET(self):
         _reset_idle_timer()
         if self.path == "/health":
@@ -313,78 +681,169 @@ class VisionHandler(BaseHTTPRequestHandler):
 
     def do_POST(self):
         _reset_idle_timer()
+        url = urlsplit(self.path)
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        raw_body = url.path == "/ground_raw" or content_type in self.RAW_IMAGE_TYPES
+        image_data = None
         try:
             content_length = int(self.headers.get("Content-Length", 0))
             if content_length > self.MAX_BODY_SIZE:
+                # Body is left unread, so the connection can't be reused
+                self.close_connection = True
                 self._send_json(413, {"error": f"Request too large ({content_length} bytes)"})
                 return
             body = self.rfile.read(content_length)
-            data = json.loads(body) if body else {}
+            if raw_body:
+                # Binary upload: the body is the image itself (no base64 bloat or
+                # decode pass); parameters ride in the query string or headers.
+                image_data = body
+                data = _ground_params_from_query(url.query)
+                description = self.headers.get("X-Description")
+                if description:
+                    data["description"] = unquote(description)
+            else:
+                data = _json_loads(body) if body else {}
         except (json.JSONDecodeError, ValueError) as e:
-            self._send_json(400, {"error": f"Invalid JSON: {e}"})
+            # A bad Content-Length may leave body bytes on the socket
+            self.close_connection = True
+            kind = "query parameters" if raw_body else "JSON"
+            self._send_json(400, {"error": f"Invalid {kind}: {e}"})
             return
 
-        if self.path == "/ground":
-            self._handle_ground(data)
-        elif self.path == "/detect":
+        if url.path in ("/ground", "/ground_raw"):
+            self._handle_ground(data, image_data)
+        elif url.path == "/detect":
             self._handle_detect(data)
-        elif self.path == "/parse":
+        elif url.path == "/parse":
             self._handle_parse(data)
         else:
             self._send_json(404, {"error": f"Not found: {self.path}"})
 
+    # (state version, encoded body) of the last /health response
+    _health_cache = (None, b"")
+
     def _handle_health(self):
-        models = []
-        if _vlm_model is not None:
-            models.append("showui-2b")
-
-        status = "ready" if _vlm_model is not None else "idle"
-        self._send_json(200, {
-            "status": status,
-            "version": __version__,
-            "models_loaded": models,
-            "model_path": MODEL_PATH,
-            "model_exists": os.path.isdir(MODEL_PATH),
-            "vlm_load_error": _vlm_load_error,
-            "idle_timeout": IDLE_TIMEOUT,
-            "pid": os.getpid(),
-        })
-
-    def _handle_ground(self, data: dict):
+        # Polled constantly by Ghost OS; re-encode (and re-stat the model
+        # directory) only after the model state has changed.
+        version = _health_state_version
+        cached_version, response = VisionHandler._health_cache
+        if cached_version != version:
+            models = []
+            if _vlm_model is not None:
+                models.append("showui-2b")
+
+            status = "ready" if _vlm_model is not None else "idle"
+            response = _json_dumps({
+                "status": status,
+                "version": __version__,
+                "models_loaded": models,
+                "model_path": MODEL_PATH,
+                "model_exists": os.path.isdir(MODEL_PATH),
+                "vlm_load_error": _vlm_load_error,
+                "idle_timeout": IDLE_TIMEOUT,
+                "pid": os.getpid(),
+            })
+            VisionHandler._health_cache = (version, response)
+        self._send_raw_json(200, response)
+
+    def _handle_ground(self, data: dict, image_data: bytes = None):
         """
         Find precise coordinates for a described UI element.
 
-        Required: image (base64 PNG), description (str)
-        Optional: screen_w, screen_h, crop_box [x1,y1,x2,y2] in logical points
+        Required: image (base64 PNG, or raw image bytes in image_data), description (str)
+        Optional: screen_w, screen_h, crop_box [x1,y1,x2,y2] in logical points,
+                  force_vlm (bool) to bypass the tiny-crop centroid fast-path,
+                  image_is_prescaled (bool) accepted from clients that send an image
+                  already at most VLM_MAX_EDGE (e.g. a 1280px JPEG); such images
+                  take the normal path, where they skip the draft decode and only
+                  get the grid snap in _prepare_vlm_image
         """
         image_b64 = data.get("image")
         description = data.get("description")
-        screen_w = float(data.get("screen_w", 1728))
-        screen_h = float(data.get("screen_h", 1117))
+        screen_w = data.get("screen_w", 1728)
+        screen_h = data.get("screen_h", 1117)
         crop_box = data.get("crop_box")  # [x1, y1, x2, y2] logical points
 
-        if not image_b64:
-            self._send_json(400, {"error": "Missing 'image' (base64 PNG)"})
+        if not image_data and not image_b64:
+            self._send_raw_json(400, _ERR_MISSING_IMAGE)
             return
         if not description:
-            self._send_json(400, {"error": "Missing 'description'"})
+            self._send_raw_json(400, _ERR_MISSING_DESCRIPTION)
             return
-
-        # Load model if needed
-        if not _load_vlm():
-            self._send_json(503, {
-                "error": "ShowUI-2B model failed to load",
-                "detail": _vlm_load_error,
-                "suggestion": "Check that model exists at " + MODEL_PATH,
-            })
+        if not (_is_screen_dim(screen_w) and _is_screen_dim(screen_h)):
+            self._send_raw_json(400, _ERR_BAD_SCREEN_SIZE)
             return
+        if crop_box and not _is_crop_box(crop_box):
+            self._send_raw_json(400, _ERR_BAD_CROP_BOX)
+            return
+        screen_w, screen_h = float(screen_w), float(screen_h)
+
+        # Tiny crop + "click this" description: the crop center is the answer
+        if crop_box and not data.get("force_vlm"):
+            x1, y1, x2, y2 = crop_box
+            if (x2 - x1) * (y2 - y1) < CENTROID_MAX_AREA and _SIMPLE_CLICK_RE.search(description):
+                cx = round((x1 + x2) / 2, 1)
+                cy = round((y1 + y2) / 2, 1)
+                self._send_json(200, {
+                    "x": cx,
+                    "y": cy,
+                    "normalized_x": round(cx / screen_w, 4),
+                    "normalized_y": round(cy / screen_h, 4),
+                    "confidence": 0.5,
+                    "raw": "",
+                    "inference_ms": 0,
+                    "method": "centroid-fastpath",
+                    "crop_box": crop_box,
+                })
+                return
 
         try:
             from PIL import Image
 
-            # Decode base64 image to temp file
-            image_data = base64.b64decode(image_b64)
-            img = Image.open(io.BytesIO(image_data))
+            # Decode base64 image and keep it in memory for the whole request
+            if image_data is None:
+                image_data = base64.b64decode(image_b64)
+
+            image_hash = _image_hash(image_data)
+            cache_key = _result_cache_key(image_hash, description, crop_box, screen_w, screen_h)
+            cached = _result_cache.get(cache_key)
+            if cached is not None:
+                cached = dict(cached)
+                cached["cache_hit"] = True
+                self._send_json(200, cached)
+                return
+
+            # Load model if needed (cache hits above don't need it)
+            if not _load_vlm():
+                self._send_json(503, {
+                    "error": "ShowUI-2B model failed to load",
+                    "detail": _vlm_load_error,
+                    "suggestion": "Check that model exists at " + MODEL_PATH,
+                })
+                return
+
+            # Same screenshot (and crop) as a recent request: reuse the prepared
+            # image and skip decoding it here. Hold on to it rather than the key,
+            # since queued requests for other screenshots may evict the entry.
+            image_key = _image_cache_key(image_hash, crop_box, screen_w, screen_h)
+            img = None
+            prepared = _image_cache.get(image_key)
+            if prepared is None:
+                img = Image.open(io.BytesIO(image_data))
+                # JPEG only (no-op for PNG): let libjpeg decode at 1/2, 1/4 or 1/8
+                # scale when the region the VLM sees (whole image or crop) will be
+                # downscaled to VLM_MAX_EDGE anyway. draft() never goes below the
+                # requested size, so the crop still covers VLM_MAX_EDGE pixels.
+                w, h = img.size
+                if crop_box:
+                    region_edge = max((crop_box[2] - crop_box[0]) * w / screen_w,
+                                      (crop_box[3] - crop_box[1]) * h / screen_h)
+                else:
+                    region_edge = max(w, h)
+                if region_edge > VLM_MAX_EDGE:
+                    scale = VLM_MAX_EDGE / region_edge
+                    img.draft("RGB", (int(w * scale), int(h * scale)))
+                img.load()
 
             if crop_box:
                 # Crop-based grounding: crop the specified region, run VLM on crop,
@@ -394,28 +853,25 @@ class VisionHandler(BaseHTTPRequestHandler):
                 crop_w = x2 - x1
                 crop_h = y2 - y1
 
-                # Calculate pixel coordinates for cropping
-                # The image from Ghost OS is already at 1280px width (logical-ish)
-                # We need to scale crop_box from logical points to image pixels
-                img_w, img_h = img.size
-                scale_x = img_w / screen_w
-                scale_y = img_h / screen_h
-
-                px1 = int(x1 * scale_x)
-                py1 = int(y1 * scale_y)
-                px2 = int(x2 * scale_x)
-                py2 = int(y2 * scale_y)
+                crop = None
+                if img is not None:
+                    # Calculate pixel coordinates for cropping
+                    # The image from Ghost OS is already at 1280px width (logical-ish)
+                    # We need to scale crop_box from logical points to image pixels
+                    img_w, img_h = img.size
+                    scale_x = img_w / screen_w
+                    scale_y = img_h / screen_h
 
-                crop = img.crop((px1, py1, px2, py2))
+                    px1 = int(x1 * scale_x)
+                    py1 = int(y1 * scale_y)
+                    px2 = int(x2 * scale_x)
+                    py2 = int(y2 * scale_y)
 
-                # Save crop to temp file
-                _cf = tempfile.NamedTemporaryFile(suffix=".png", prefix="ghost_crop_", delete=False)
-                crop_path = _cf.name
-                _cf.close()
-                crop.save(crop_path)
+                    crop = img.crop((px1, py1, px2, py2))
 
                 # Run VLM on crop with crop dimensions
-                result = _vlm_ground(crop_path, description, crop_w, crop_h)
+                result = _submit_ground(crop, description, crop_w, crop_h,
+                                        image_key=image_key, prepared=prepared)
 
                 # Map coordinates back to full screen
                 result["x"] = round(x1 + result["x"], 1)
@@ -424,28 +880,20 @@ class VisionHandler(BaseHTTPRequestHandler):
                 result["normalized_y"] = round(result["y"] / screen_h, 4)
                 result["method"] = "crop-based"
                 result["crop_box"] = crop_box
-
-                try:
-                    os.unlink(crop_path)
-                except OSError:
-                    pass
             else:
                 # Full-screen grounding
-                _ff = tempfile.NamedTemporaryFile(suffix=".png", prefix="ghost_full_", delete=False)
-                img_path = _ff.name
-                _ff.close()
-                img.save(img_path)
-
-                result = _vlm_ground(img_path, description, screen_w, screen_h)
+                result = _submit_ground(img, description, screen_w, screen_h,
+                                        image_key=image_key, prepared=prepared)
                 result["method"] = "full-screen"
 
-                try:
-                    os.unlink(img_path)
-                except OSError:
-                    pass
-
+            if "error" not in result:
+                _result_cache.put(cache_key, dict(result))
+            result["cache_hit"] = False
             self._send_json(200, result)
 
+        except concurrent.futures.TimeoutError:
+            log(f"/ground '{description}' timed out after {GROUND_TIMEOUT:.0f}s")
+            self._send_json(504, {"error": f"Grounding timed out after {GROUND_TIMEOUT:.0f}s"})
         except Exception as e:
             log(f"ERROR in /ground: {e}")
             traceback.print_exc(file=sys.stderr)
@@ -460,12 +908,7 @@ class VisionHandler(BaseHTTPRequestHandler):
         When implemented, this will use YOLOv11 (Screen2AX) to detect buttons,
         text fields, links, etc. with bounding boxes.
         """
-        self._send_json(200, {
-            "elements": [],
-            "count": 0,
-            "note": "YOLO element detection not yet implemented. Use /ground for VLM-based element finding.",
-            "suggestion": "Use ghost_find (AX tree) first, fall back to /ground for specific elements.",
-        })
+        self._send_raw_json(200, _STUB_DETECT_BYTES)
 
     def _handle_parse(self, data: dict):
         """
@@ -473,17 +916,17 @@ class VisionHandler(BaseHTTPRequestHandler):
 
         Placeholder for combined YOLO detection + VLM context analysis.
         """
-        self._send_json(200, {
-            "elements": [],
-            "context": "Screen parsing not yet implemented.",
-            "suggestion": "Use ghost_context for AX-based context, ghost_screenshot + /ground for visual grounding.",
-        })
+        self._send_raw_json(200, _STUB_PARSE_BYTES)
 
     def _send_json(self, status: int, data: dict):
-        response = json.dumps(data).encode("utf-8")
+        self._send_raw_json(status, _json_dumps(data))
+
+    def _send_raw_json(self, status: int, response: bytes):
+        """Send an already-encoded JSON body (see the pre-encoded constants below)."""
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(response)))
+        self.send_header("Connection", "close" if self.close_connection else "keep-alive")
         self.end_headers()
         self.wfile.write(response)
 
@@ -492,6 +935,81 @@ class VisionHandler(BaseHTTPRequestHandler):
         log(f"HTTP {args[0]}")
 
 
+# ── Request / Response Encoding ────────────────────────────────────
+
+def _json_loads(body: bytes):
+    """Parse a JSON request body (orjson.JSONDecodeError subclasses json's)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize a response body to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+# Constant response bodies, encoded once at import
+_ERR_MISSING_IMAGE = _json_dumps({"error": "Missing 'image' (base64 PNG or raw image body)"})
+_ERR_MISSING_DESCRIPTION = _json_dumps({"error": "Missing 'description'"})
+_ERR_BAD_CROP_BOX = _json_dumps({"error": "crop_box must be [x1, y1, x2, y2] numbers"})
+_ERR_BAD_SCREEN_SIZE = _json_dumps({"error": "screen_w and screen_h must be positive numbers"})
+_STUB_DETECT_BYTES = _json_dumps({
+    "elements": [],
+    "count": 0,
+    "note": "YOLO element detection not yet implemented. Use /ground for VLM-based element finding.",
+    "suggestion": "Use ghost_find (AX tree) first, fall back to /ground for specific elements.",
+})
+_STUB_PARSE_BYTES = _json_dumps({
+    "elements": [],
+    "context": "Screen parsing not yet implemented.",
+    "suggestion": "Use ghost_context for AX-based context, ghost_screenshot + /ground for visual grounding.",
+})
+
+
+def _ground_params_from_query(query: str) -> dict:
+    """
+    Build /ground parameters from a query string (raw image uploads).
+
+    crop_box is "x1,y1,x2,y2"; force_vlm and image_is_prescaled are "1"/"true".
+    Raises ValueError on a malformed crop_box or a screen_w/screen_h that is
+    not a finite positive number.
+    """
+    params = {key: values[-1] for key, values in parse_qs(query).items()}
+    for dim in ("screen_w", "screen_h"):
+        if dim in params:
+            params[dim] = float(params[dim])
+            if not _is_screen_dim(params[dim]):
+                raise ValueError(f"{dim} must be a positive number")
+    if "crop_box" in params:
+        crop_box = [float(v) for v in params["crop_box"].split(",")]
+        if len(crop_box) != 4:
+            raise ValueError("crop_box must be x1,y1,x2,y2")
+        params["crop_box"] = crop_box
+    for flag in ("force_vlm", "image_is_prescaled"):
+        if flag in params:
+            params[flag] = params[flag].lower() in ("1", "true", "yes")
+    return params
+
+
+def _is_screen_dim(value) -> bool:
+    """True for a finite, positive screen_w/screen_h number."""
+    return (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        and math.isfinite(value) and value > 0
+    )
+
+
+def _is_crop_box(value) -> bool:
+    """True for a JSON crop_box of exactly four numbers."""
+    return (
+        isinstance(value, (list, tuple)) and len(value) == 4
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value)
+    )
+
+
 # ── Logging ────────────────────────────────────────────────────────
 
 def log(msg: str):
@@ -539,13 +1057,21 @@ def parse_args():
         "--model-path", default=None,
         help="Path to ShowUI-2B model directory. Auto-detected if not specified.",
     )
+    parser.add_argument(
+        "--quant", choices=["4bit", "bf16"], default="4bit",
+        help="Preferred weight format when auto-detecting the model (default: 4bit, falls back to bf16)",
+    )
     parser.add_argument(
         "--idle-timeout", type=int, default=600,
         help="Auto-exit after N seconds of no requests (default: 600, 0 to disable)",
     )
     parser.add_argument(
         "--preload", action="store_true",
-        help="Pre-load the VLM model at startup instead of lazy-loading on first request",
+        help="Load and warm up the VLM before accepting connections (default: in the background)",
+    )
+    parser.add_argument(
+        "--lazy", action="store_true",
+        help="Don't load the VLM at startup; load it on the first /ground request",
     )
     parser.add_argument(
         "--health-check", action="store_true",
@@ -563,7 +1089,7 @@ def main():
 
     HOST = args.host
     PORT = args.port
-    MODEL_PATH = resolve_model_path(args.model_path)
+    MODEL_PATH = resolve_model_path(args.model_path, args.quant)
     IDLE_TIMEOUT = args.idle_timeout
 
     # --health-check: try to load model and exit
@@ -592,23 +1118,38 @@ def main():
     else:
         log("Idle timeout: disabled")
 
-    # Pre-load VLM if requested
-    if args.preload:
+    # Start idle watchdog
+    if IDLE_TIMEOUT > 0:
+        _reset_idle_timer()
+        Thread(target=_idle_watchdog, name="idle-watchdog", daemon=True).start()
+
+    # Single inference thread: all model calls happen here
+    Thread(target=_batch_worker, name="vlm-batch", daemon=True).start()
+
+    # Load and warm up the VLM so the first /ground doesn't pay for it
+    if args.lazy:
+        log("Lazy loading: VLM will load on first /ground request")
+    elif args.preload:
         log("Pre-loading VLM model...")
         _load_vlm()
-
-    # Start idle timer
-    _reset_idle_timer()
+    else:
+        log("Loading VLM model in the background...")
+        Thread(target=_load_vlm, name="vlm-warmup", daemon=True).start()
 
     # Allow port reuse to prevent "Address already in use" on restart
-    class ReusableTCPServer(HTTPServer):
+    class ReusableTCPServer(ThreadingHTTPServer):
         allow_reuse_address = True
+        # Handler threads must not keep the process alive on shutdown
+        daemon_threads = True
+        # Listen backlog. The socketserver default of 5 refuses connections
+        # when several agents hit /ground while a batch is decoding.
+        request_queue_size = 64
         # Do NOT set allow_reuse_port -- on Python 3.12+ it enables SO_REUSEPORT
         # which allows multiple servers on the same port (not what we want).
 
     _server_instance = ReusableTCPServer((HOST, PORT), VisionHandler)
     log(f"Listening on http://{HOST}:{PORT}")
-    log("Endpoints: GET /health, POST /ground, POST /detect, POST /parse")
+    log("Endpoints: GET /health, POST /ground, POST /ground_raw, POST /detect, POST /parse")
 
     try:
         _server_instance.serve_forever()